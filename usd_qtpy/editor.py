@@ -43,18 +43,23 @@ class EditorWindow(QtWidgets.QWidget):
             include_session_layer=False,
             parent=self
         )
-        splitter.addWidget(layer_tree_widget)
-
         hierarchy_widget = prim_hierarchy.HierarchyWidget(stage=stage)
-        splitter.addWidget(hierarchy_widget)
-
         viewer_widget = None
         if HAS_VIEWER:
             viewer_widget = viewer.Widget(stage=stage)
-            splitter.addWidget(viewer_widget)
-
         prim_spec_editor_widget = prim_spec_editor.SpecEditorWindow(stage=stage)
-        splitter.addWidget(prim_spec_editor_widget)
+
+        # Add all panels in one pass with updates disabled to avoid
+        # intermediate repaints of the splitter while it is populated
+        splitter.setUpdatesEnabled(False)
+        try:
+            splitter.addWidget(layer_tree_widget)
+            splitter.addWidget(hierarchy_widget)
+            if viewer_widget is not None:
+                splitter.addWidget(viewer_widget)
+            splitter.addWidget(prim_spec_editor_widget)
+        finally:
+            splitter.setUpdatesEnabled(True)
 
         # set up widgets to have a respective entry in Panels menu,
         # and filter them out if they are ill-defined. 
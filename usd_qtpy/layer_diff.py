@@ -35,7 +35,6 @@ def preserve_scroll(scroll_area):
     try:
         yield
     finally:
-        print(h_percent, v_percent)
         set_percent(horizontal, h_percent)
         set_percent(vertical, v_percent)
 
@@ -102,10 +101,11 @@ class LayerDiffWidget(QtWidgets.QDialog):
             lineterm=""
         )
 
+        # Set the text in one go; inserting line by line makes the text
+        # document relayout on each insert which is slow for large diffs
+        text = "".join(f"{line}\n" for line in generator)
         with preserve_scroll(self._text_edit):
-            self._text_edit.clear()
-            for line in generator:
-                self._text_edit.insertPlainText(f"{line}\n")
+            self._text_edit.setPlainText(text)
 
     def on_layers_changed(self, notice, sender):
         # TODO: We could also cache the ASCII of the USD files so that on
@@ -582,7 +582,7 @@ class LayerTreeWidget(QtWidgets.QWidget):
             action.setStatusTip(
                 "Reloads the layer. This discards any unsaved local changes."
             )
-            action.triggered.connect(lambda: layer.Reload())
+            action.triggered.connect(partial(layer.Reload))
 
             is_root_layer = layer == stage.GetRootLayer()
             is_session_layer = layer == stage.GetSessionLayer()
@@ -35,12 +35,16 @@ def iter_model_rows(model, column, include_root=False):
     """Iterate over all row indices in a model"""
     indices = [QtCore.QModelIndex()]  # start iteration at root
 
+    # Bind the methods used per row once, outside the loop
+    row_count = model.rowCount
+    get_index = model.index
+    add_index = indices.append
+
     for index in indices:
         # Add children to the iterations
-        child_rows = model.rowCount(index)
+        child_rows = row_count(index)
         for child_row in range(child_rows):
-            child_index = model.index(child_row, column, index)
-            indices.append(child_index)
+            add_index(get_index(child_row, column, index))
 
         if not include_root and not index.isValid():
             continue
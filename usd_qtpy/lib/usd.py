@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import lru_cache
 
 from pxr import Usd, Plug, Tf, Sdf
 import logging
@@ -27,9 +28,15 @@ NICE_PLUGIN_TYPE_NAMES = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_prim_types_by_group() -> dict:
     """Return all registered concrete type names by nice plug-in grouping.
 
+    The result is cached since walking the plug-in registry is slow and the
+    registered types rarely change during a session. Call
+    `get_prim_types_by_group.cache_clear()` after registering new plug-ins.
+    The returned dict is shared between calls and should not be modified.
+
     Returns:
         dict: Schema type names grouped by plug-in name.
 
@@ -6,24 +6,37 @@ from pxr import Usd, Sdf
 
 log = logging.getLogger(__name__)
 
+ROOT_PATH = Sdf.Path.absoluteRootPath
+
 
 class Proxy:
     def __init__(self, prim: Usd.Prim):
         self._prim: Usd.Prim = prim
+        self._path: Sdf.Path = prim.GetPath()
         self._children: List[Sdf.Path] = []
+        self._child_rows: Dict[Sdf.Path, int] = {}
 
     def refresh_children(self, predicate):
         self._children = [
             child_prim.GetPath()
             for child_prim in self._prim.GetFilteredChildren(predicate)
         ]
+        self._child_rows = {
+            path: row for row, path in enumerate(self._children)
+        }
 
     def get_children(self) -> List[Sdf.Path]:
         return self._children
 
+    def get_child_row(self, path: Sdf.Path) -> int:
+        return self._child_rows[path]
+
     def get_prim(self) -> Usd.Prim:
         return self._prim
 
+    def get_path(self) -> Sdf.Path:
+        return self._path
+
 
 class HierarchyCache:
     def __init__(self,
@@ -68,16 +81,16 @@ class HierarchyCache:
 
         child_path = proxy.get_children()[index]
 
-        if child_path not in self._path_to_proxy:
+        child = self._path_to_proxy.get(child_path)
+        if child is None:
             child_prim = proxy.get_prim().GetChild(child_path.name)
             self._register_prim(child_prim)
+            child = self._path_to_proxy[child_path]
 
-        return self._path_to_proxy[child_path]
+        return child
 
     def get_parent(self, proxy: Proxy):
-        prim = proxy.get_prim()
-        path = prim.GetPath()
-        parent_path = path.GetParentPath()
+        parent_path = proxy.get_path().GetParentPath()
         return self._path_to_proxy[parent_path]
 
     def get_child_count(self, proxy: Proxy) -> int:
@@ -107,10 +120,9 @@ class HierarchyCache:
             log.debug("Skipping deletion of uninstantiated path: '%s'", path)
 
     def resync_subtrees(self, paths: set[Sdf.Path]):
-        root_path = Sdf.Path("/")
-        if root_path in paths:
+        if ROOT_PATH in paths:
             # Resync all
-            unique_parents = {root_path}
+            unique_parents = {ROOT_PATH}
         else:
             unique_parents = {path.GetParentPath() for path in paths}
 
@@ -137,9 +149,6 @@ class HierarchyCache:
         if self.is_root(proxy):
             return 0
 
-        parent_path = proxy.get_prim().GetPath().GetParentPath()
-        parent = self._path_to_proxy[parent_path]
-
-        prim = proxy.get_prim()
-        path = prim.GetPath()
-        return parent.get_children().index(path)
\ No newline at end of file
+        path = proxy.get_path()
+        parent = self._path_to_proxy[path.GetParentPath()]
+        return parent.get_child_row(path)
\ No newline at end of file
@@ -89,7 +89,7 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         with self.reset_model():
             if self._is_stage_valid():
                 self._index = HierarchyCache(
-                    root=stage.GetPrimAtPath("/"),
+                    root=stage.GetPseudoRoot(),
                     predicate=self._predicate
                 )
                 self.register_listeners()
@@ -153,8 +153,7 @@ class HierarchyModel(QtCore.QAbstractItemModel):
             persistent_indices = self.persistentIndexList()
             index_to_path = {}
             for index in persistent_indices:
-                index_prim = index.internalPointer().get_prim()
-                index_path = index_prim.GetPath()
+                index_path = index.internalPointer().get_path()
                 if (
                         index_path in resynced_paths_and_parents
                         or index_path.GetParentPath() in resynced_paths_and_parents
@@ -18,6 +18,7 @@ SPECIFIER_LABEL = {
     Sdf.SpecifierOver: "over",
     Sdf.SpecifierClass: "abstract"
 }
+LABEL_SPECIFIER = {label: key for key, label in SPECIFIER_LABEL.items()}
 
 
 def shorten(s, width, placeholder="..."):
@@ -273,10 +274,7 @@ class StageSdfModel(TreeModel):
             item = index.internalPointer()
             spec = item.get("spec")
             if spec and isinstance(spec, Sdf.PrimSpec):
-                lookup = {
-                    label: key for key, label in SPECIFIER_LABEL.items()
-                }
-                value = lookup[value]
+                value = LABEL_SPECIFIER[value]
                 spec.specifier = value
 
     def data(self, index, role):
@@ -13,8 +13,10 @@ class PrimTypeIconProvider:
         self._type_to_icon = {}
 
     def get_icon_from_type_name(self, type_name):
-        if type_name in self._type_to_icon:
+        try:
             return self._type_to_icon[type_name]
+        except KeyError:
+            pass
 
         # Icon by type matches
         # TODO: Rewrite the checks below to be based off of the base type
@@ -155,7 +155,9 @@ class RefPayloadWidget(QtWidgets.QWidget):
         if not os.path.exists(filepath):
             raise ValueError(f"File does not exist: {filepath}")
 
-        stage = Usd.Stage.Open(filepath)
+        # Only the prim hierarchy is needed to pick a path so avoid loading
+        # any payloads of the file
+        stage = Usd.Stage.Open(filepath, Usd.Stage.LoadNone)
         picker = PickPrimPath(stage=stage, prim_path=prim_path, parent=self)
 
         def on_picked(path):
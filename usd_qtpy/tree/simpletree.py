@@ -121,6 +121,7 @@ class Item(dict):
 
         self._children = list()
         self._parent = None
+        self._row = -1
 
         if data is not None:
             assert isinstance(data, dict)
@@ -147,12 +148,10 @@ class Item(dict):
         """
         Returns:
              int: Index of this item under parent"""
-        if self._parent is not None:
-            siblings = self.parent().children()
-            return siblings.index(self)
-        return -1
+        return self._row
 
     def add_child(self, child):
         """Add a child to this item"""
         child._parent = self
+        child._row = len(self._children)
         self._children.append(child)
@@ -163,10 +163,12 @@ QSlider::handle:horizontal {
             self._timer.stop()
             self.playbackStopped.emit()
 
+    @QtCore.Slot()
     def toggle_play(self):
         # Toggle play state
         self.playing = not self.playing
 
+    @QtCore.Slot()
     def _advanceFrameForPlayback(self):
 
         # This should actually make sure that the playback speed
@@ -184,6 +186,7 @@ QSlider::handle:horizontal {
 
         self.slider.setValue(frame)
 
+    @QtCore.Slot(int)
     def _frameChanged(self, frame):
         """Trigger a frame change callback together with whether it's currently playing."""
 
@@ -453,6 +456,7 @@ class Widget(QtWidgets.QWidget):
         # Ensure to close the renderer to avoid GlfPostPendingGLErrors
         self.view.closeRenderer()
 
+    @QtCore.Slot(int, bool)
     def on_frame_changed(self, value, playback):
         self.model.currentFrame = Usd.TimeCode(value)
         if playback:
@@ -460,10 +464,12 @@ class Widget(QtWidgets.QWidget):
         else:
             self.view.updateView()
 
+    @QtCore.Slot()
     def on_playback_stopped(self):
         self.model.playing = False
         self.view.updateView()
 
+    @QtCore.Slot()
     def on_playback_started(self):
         self.model.playing = True
         self.view.updateForPlayback()